@@ -7,371 +7,718 @@ import win32com.client
 import win32clipboard
 import win32con
 import pythoncom
-import keyboard
 import time
 import threading
 import queue
 import logging
-import configparser
+import logging.handlers
+import atexit
+import contextlib
+import base64
+import io
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
 import sys
 import os
-import msvcrt
 import re
 import argparse
+import win32api
+import win32event
 import win32gui
-import win32con
-import pystray
-from PIL import Image, ImageDraw
+import pywintypes
 import ctypes
-from ctypes import wintypes
+# pystray and PIL are imported by the tray functions: they are the slowest
+# imports and the tray is only set up after the hotkeys are live
 
 # Logging will be configured in main() based on debug mode
 
-# Global variables
-voice = None
-event_queue = queue.Queue()
-last_hotkey_time = time.time()
-running = True
-hotkey_handlers = []
-debug_mode = False
-tray_icon = None
+# Caches that live for the whole process
+_SETTINGS = None  # Parsed settings.ini, cached by get_settings()
+_voice_token_cache = {}  # Voice token ID -> SpObjectToken, filled by cache_voice_tokens()
+_voice_name_cache = {}  # Voice token ID -> description, filled by get_voice_name()
+
+# SpeechVoiceSpeakFlags for voice.Speak()
+SVSF_ASYNC = 1  # SVSFlagsAsync
+SVSF_PURGE_BEFORE_SPEAK = 2  # SVSFPurgeBeforeSpeak
+SVSF_ASYNC_PURGE = SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK
+
+# COM errors after which the voice is recreated in speak_text()
+CO_E_NOTINITIALIZED = -2147221008
+RPC_E_DISCONNECTED = -2147417848  # SAPI object's server went away
+RPC_S_SERVER_UNAVAILABLE = -2147023174
+VOICE_RECOVERY_HRESULTS = {
+    CO_E_NOTINITIALIZED, RPC_E_DISCONNECTED, RPC_S_SERVER_UNAVAILABLE
+}
+DISP_E_EXCEPTION = -2147352567  # Late-bound call failed; real code is in excepinfo
+
+# settings.ini entries: "key = value" or "key: value", as configparser accepts
+_SETTING_LINE_RE = re.compile(r'([^=:]+?)\s*[=:]\s*(.*)')
+
+# Pending main loop events kept before new ones are dropped
+EVENT_QUEUE_SIZE = 16
+
+# Seconds between main loop heartbeats
+HEARTBEAT_INTERVAL = 30
+
+# Clipboard open retries: first delay, longest delay and total budget in seconds
+CLIPBOARD_RETRY_DELAY = 0.005
+CLIPBOARD_RETRY_MAX_DELAY = 0.05
+CLIPBOARD_RETRY_BUDGET = 0.5
+ERROR_ACCESS_DENIED = 5  # OpenClipboard failure while another app holds it
+
+HWND_MESSAGE = -3
+MWMO_INPUTAVAILABLE = 0x0004  # Also wake for messages already seen but not removed
+WM_REREGISTER_HOTKEYS = win32con.WM_APP + 1  # Posted by the tray menu to the worker
+
+# 64x64 tray icon PNG: white microphone on blue, pre-rendered so startup
+# doesn't draw it with PIL (ellipse 16,40-48,56 base, rectangle 28,20-36,40
+# handle, ellipse 20,8-44,32 head)
+_ICON_PNG = (
+    b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAIAAAAlC+aJAAAAlklEQVR42u3a0Q2AIAwFQPZf'
+    b'WhcwURGwLffiANyPpS+01o7kHwAAAABAQMBlcgBuExfwKuEAHQkE6E4IwMcA/Hr6EYadAQMD'
+    b'AAAAsCPAIAsAcJmzD9jIquzEFVqJJ4YcxRYAAAAAwGaDLPFlLvFCMzxLAZOyCDA10wELAgAA'
+    b'4C9UfA5UmMSlyt0i1WKpYsuTMwAAgH0AJ6sSt4yP8oZ8AAAAAElFTkSuQmCC'
+)
+
+# Language detection looks at this many leading characters of the text
+LANGUAGE_SAMPLE_CHARS = 4096
+_CYRILLIC_RE = re.compile(r'[А-Яа-яЁё]')
+_HEBREW_RE = re.compile(r'[\u0590-\u05ff]')
+
+# Text longer than this is spoken in sentence chunks, at most
+# MAX_SPEECH_CHUNKS of them (the remainder stays in the last chunk)
+SPEECH_CHUNK_MIN_CHARS = 500
+MAX_SPEECH_CHUNKS = 64
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Global hotkeys registered with RegisterHotKey
+HOTKEY_READ_ID = 1  # Alt+Q
+HOTKEY_STOP_ID = 2  # Alt+Shift+Q
+MOD_NOREPEAT = 0x4000  # Don't fire again while the keys are held down
+VK_Q = ord('Q')
+HOTKEYS = (
+    (HOTKEY_READ_ID, win32con.MOD_ALT, "Alt+Q"),
+    (HOTKEY_STOP_ID, win32con.MOD_ALT | win32con.MOD_SHIFT, "Alt+Shift+Q"),
+)
+# Saves each call's error code, so a failed RegisterHotKey reports its own reason
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+@dataclass
+class TTSApp:
+    """Application state shared by the main loop, TTS worker and tray threads"""
+    debug_mode: bool = False
+    list_voices: bool = False  # --list-voices: print installed voices at startup
+    running: bool = True
+    voice: Any = None  # SAPI.SpVoice, only used on the TTS worker thread
+    event_queue: queue.Queue = field(default_factory=lambda: queue.Queue(maxsize=EVENT_QUEUE_SIZE))
+    last_hotkey_time: float = field(default_factory=time.monotonic)
+    wake_event: Any = None  # Win32 event that wakes the main loop
+    tts_queue: queue.Queue = field(default_factory=queue.Queue)  # ('read', text) / ('stop', None) / ('quit', None)
+    tts_thread: Optional[threading.Thread] = None  # Worker thread that owns the SAPI voice
+    tts_event: Any = None  # Win32 event that wakes the TTS worker when a command is queued
+    worker_ready: threading.Event = field(default_factory=threading.Event)  # Voice and hotkeys set up
+    message_hwnd: Any = None  # Worker's message-only window for WM_HOTKEY
+    hotkeys_registered: bool = False  # All HOTKEYS registered
+    failed_hotkeys: list = field(default_factory=list)  # Names RegisterHotKey refused
+    stop_requests: int = 0  # Bumped by every stop, so pending reads can see it
+    read_stop_requests: int = 0  # stop_requests when the latest read was requested
+    last_clip_text: Optional[str] = None  # Text from the last clipboard read
+    last_clip_seq: int = 0  # GetClipboardSequenceNumber() when last_clip_text was read
+    detected_text: Optional[str] = None  # Text the cached language detection is for
+    detected_voice_id: Optional[str] = None  # detect_language() result for detected_text
+    current_voice_id: Optional[str] = None  # Voice token ID currently selected on voice
+    tray_icon: Any = None
 
 def load_settings():
     """Load settings from settings.ini"""
-    config = configparser.ConfigParser()
-    
     # Default settings (removed voice_id since we auto-detect language)
     defaults = {
         'speech_rate': '0',
         'volume': '100'
     }
     
-    if os.path.exists('settings.ini'):
-        config.read('settings.ini')
-        settings = {}
-        for key in defaults:
-            settings[key] = config.get('DEFAULT', key, fallback=defaults[key])
-    else:
-        settings = defaults
+    # The file only holds a couple of entries in its [DEFAULT] section, so
+    # parse it directly rather than pulling in configparser
+    try:
+        with open('settings.ini') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
         # Create default settings file
-        config['DEFAULT'] = defaults
         with open('settings.ini', 'w') as f:
-            config.write(f)
+            f.write("[DEFAULT]\n")
+            for key, value in defaults.items():
+                f.write(f"{key} = {value}\n")
+        return dict(defaults)
+    except OSError as e:
+        # Locked or unreadable - keep the user's file and run with defaults
+        logging.warning(f"Could not read settings.ini, using defaults: {e}")
+        return dict(defaults)
+    
+    settings = dict(defaults)
+    section = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith((';', '#')):
+            continue
+        if line.startswith('['):
+            section = line[1:].partition(']')[0]
+        elif section == 'DEFAULT':
+            match = _SETTING_LINE_RE.match(line)
+            if match and match.group(1).lower() in defaults:
+                settings[match.group(1).lower()] = match.group(2)
     
     return settings
 
-def list_available_voices():
-    """List all available TTS voices"""
+def get_settings():
+    """Return settings from settings.ini, parsed once and cached for the run"""
+    global _SETTINGS
+    
+    if _SETTINGS is None:
+        settings = load_settings()
+        # Convert once here so voice (re)initialization doesn't repeat it
+        settings['speech_rate'] = int(settings['speech_rate'])
+        settings['volume'] = int(settings['volume'])
+        _SETTINGS = settings
+    
+    return _SETTINGS
+
+def invalidate_settings():
+    """Forget the cached settings so the next get_settings() re-reads the file"""
+    global _SETTINGS
+    _SETTINGS = None
+
+def cache_voice_tokens(voice):
+    """Enumerate the installed voices once and cache their tokens by ID"""
+    if _voice_token_cache:
+        return
+    
+    voices = voice.GetVoices()
+    for i in range(voices.Count):
+        token = voices.Item(i)
+        _voice_token_cache[token.Id] = token
+
+def get_voice_name(voice_id):
+    """Return a cached voice's description, fetching it over COM only once"""
+    name = _voice_name_cache.get(voice_id)
+    if name is None:
+        name = _voice_token_cache[voice_id].GetDescription()
+        _voice_name_cache[voice_id] = name
+    return name
+
+def list_available_voices(app):
+    """List all available TTS voices using the already created voice"""
     try:
-        temp_voice = win32com.client.Dispatch("SAPI.SpVoice")
-        voices = temp_voice.GetVoices()
+        # Reuse the tokens enumerated when the voice was set up
+        cache_voice_tokens(app.voice)
+        voice_infos = [(get_voice_name(voice_id), voice_id)
+                       for voice_id in _voice_token_cache]
         
         print("\n=== Available Voices ===")
-        for i in range(voices.Count):
-            voice_info = voices.Item(i)
-            name = voice_info.GetDescription()
-            voice_id = voice_info.Id
+        for i, (name, voice_id) in enumerate(voice_infos):
             print(f"{i+1}. {name}")
             print(f"   ID: {voice_id}")
             print("-" * 40)
         print("=" * 40)
         
-        return voices
+        return voice_infos
     except Exception as e:
         logging.error(f"Error listing voices: {e}")
         return None
 
-def setup_voice():
+def setup_voice(app):
     """Initialize and configure the TTS voice"""
-    global voice
-    
     try:
-        pythoncom.CoInitialize()
-        voice = win32com.client.Dispatch("SAPI.SpVoice")
+        app.voice = win32com.client.Dispatch("SAPI.SpVoice")
+        cache_voice_tokens(app.voice)
         
         # Apply initial settings (will be reapplied when voice changes)
-        apply_voice_settings()
+        apply_voice_settings(app)
         
-        logging.info(f"Voice configured: Rate={voice.Rate}, Volume={voice.Volume}")
+        logging.info(f"Voice configured: Rate={app.voice.Rate}, Volume={app.voice.Volume}")
         
     except Exception as e:
         logging.error(f"Error setting up voice: {e}")
-        voice = None
+        app.voice = None
 
-def apply_voice_settings():
+def apply_voice_settings(app):
     """Apply speech rate and volume settings to current voice"""
-    global voice
-    
+    voice = app.voice
     if not voice:
         return
     
     try:
-        settings = load_settings()
+        settings = get_settings()
         
         # Set speech rate (-10 to 10)
-        voice.Rate = int(settings['speech_rate'])
+        voice.Rate = settings['speech_rate']
         
         # Set volume (0 to 100)
-        voice.Volume = int(settings['volume'])
+        voice.Volume = settings['volume']
         
-        logging.debug(f"Applied settings: Rate={voice.Rate}, Volume={voice.Volume}")
+        logging.debug("Applied settings: Rate=%d, Volume=%d",
+                      settings['speech_rate'], settings['volume'])
         
     except Exception as e:
         logging.error(f"Error applying voice settings: {e}")
 
+@contextlib.contextmanager
+def clipboard_ctx(timeout=CLIPBOARD_RETRY_BUDGET):
+    """Hold the clipboard open, backing off while another application has it"""
+    # Another application may briefly hold the clipboard open - back off
+    # exponentially up to a capped delay, polling until the budget is spent
+    deadline = time.monotonic() + timeout
+    delay = CLIPBOARD_RETRY_DELAY
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            win32clipboard.OpenClipboard()
+            break
+        except pywintypes.error as e:
+            remaining = deadline - time.monotonic()
+            if e.winerror != ERROR_ACCESS_DENIED or remaining <= 0:
+                logging.info(f"Could not open clipboard after {attempt} attempts: {e}")
+                raise
+            sleep_time = min(delay, remaining)
+            logging.debug("Clipboard attempt %d locked, retrying in %.0fms", attempt, sleep_time * 1000)
+            time.sleep(sleep_time)
+            delay = min(delay * 2, CLIPBOARD_RETRY_MAX_DELAY)
+    
+    try:
+        yield
+    finally:
+        win32clipboard.CloseClipboard()
+
 def read_clipboard():
     """Read text from clipboard with retry logic and proper Unicode support"""
     logging.debug("read_clipboard() called")
     
-    for attempt in range(3):
-        try:
-            win32clipboard.OpenClipboard()
-            try:
-                # Try Unicode format first (CF_UNICODETEXT)
-                if win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
-                    text = win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
-                    text = text.strip()
-                    if text:
-                        logging.debug(f"Clipboard text length: {len(text)} (Unicode)")
-                        # Log a safe representation of the text for debugging
-                        safe_text = text.encode('ascii', errors='replace').decode('ascii')
-                        logging.debug(f"Text preview: {safe_text[:50]}...")
-                        return text
-                    else:
-                        logging.debug(f"Clipboard attempt {attempt + 1}: empty (Unicode)")
-                # Fallback to regular text format
-                elif win32clipboard.IsClipboardFormatAvailable(win32con.CF_TEXT):
-                    text = win32clipboard.GetClipboardData(win32con.CF_TEXT)
-                    if isinstance(text, bytes):
-                        text = text.decode('utf-8', errors='ignore')
-                    text = text.strip()
-                    if text:
-                        logging.debug(f"Clipboard text length: {len(text)} (ANSI)")
-                        return text
-                    else:
-                        logging.debug(f"Clipboard attempt {attempt + 1}: empty (ANSI)")
-                else:
-                    logging.debug(f"Clipboard attempt {attempt + 1}: no text format")
-            finally:
-                win32clipboard.CloseClipboard()
-        except Exception as e:
-            logging.debug(f"Clipboard attempt {attempt + 1} failed: {e}")
-        
-        if attempt < 2:  # Don't sleep after the last attempt
-            time.sleep(0.1)
+    # Windows synthesizes CF_UNICODETEXT from CF_TEXT, so this also covers
+    # ANSI-only sources. The check doesn't need the clipboard open, so a
+    # clipboard without text is answered without locking or retrying
+    if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+        logging.info("Clipboard has no text – nothing to read.")
+        return None
     
-    logging.info("Clipboard empty after 3 attempts – nothing to read.")
+    try:
+        with clipboard_ctx():
+            text = win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+            # Only copy the (possibly huge) text when there's something to trim
+            if text and (text[0].isspace() or text[-1].isspace()):
+                text = text.strip()
+            if text:
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Clipboard text length: %d", len(text))
+                    # Log a safe representation of the text for debugging,
+                    # encoding only the part that is shown
+                    safe_text = text[:50].encode('ascii', errors='replace').decode('ascii')
+                    logging.debug("Text preview: %s...", safe_text)
+                return text
+    except Exception as e:
+        logging.debug("Reading clipboard failed: %s", e)
+        return None
+    
+    logging.info("Clipboard empty – nothing to read.")
     return None
 
+def message_wndproc(app, hwnd, msg, wparam, lparam):
+    """Window procedure for the TTS worker's message-only window"""
+    if msg == win32con.WM_HOTKEY:
+        if wparam == HOTKEY_READ_ID:
+            handle_read_request(app)
+        elif wparam == HOTKEY_STOP_ID:
+            handle_stop_request(app)
+        return 0
+    if msg == WM_REREGISTER_HOTKEYS:
+        unregister_hotkeys(app)
+        if register_hotkeys(app):
+            show_notification(app, "SendToTTS", "Hotkeys re-registered")
+        else:
+            show_notification(app, "SendToTTS", describe_hotkey_failure(app))
+        return 0
+    return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+def create_message_window(app):
+    """Create a message-only window for hotkey notifications"""
+    try:
+        wc = win32gui.WNDCLASS()
+        wc.lpfnWndProc = lambda hwnd, msg, wparam, lparam: message_wndproc(
+            app, hwnd, msg, wparam, lparam)
+        wc.lpszClassName = "SendToTTSMessageWindow"
+        wc.hInstance = win32api.GetModuleHandle(None)
+        class_atom = win32gui.RegisterClass(wc)
+        
+        app.message_hwnd = win32gui.CreateWindowEx(
+            0, class_atom, "SendToTTS", 0, 0, 0, 0, 0,
+            HWND_MESSAGE, 0, wc.hInstance, None)
+        
+    except Exception as e:
+        logging.error(f"Failed to create message window: {e}")
+        app.message_hwnd = None
+
+def destroy_message_window(app):
+    """Destroy the message-only window"""
+    if not app.message_hwnd:
+        return
+    
+    try:
+        win32gui.DestroyWindow(app.message_hwnd)
+    except Exception as e:
+        logging.error(f"Error destroying message window: {e}")
+    app.message_hwnd = None
+
+def get_clipboard_text(app):
+    """Return clipboard text, only re-reading the clipboard after it changed"""
+    # The sequence number changes exactly when the clipboard contents change
+    seq = ctypes.windll.user32.GetClipboardSequenceNumber()
+    if seq == app.last_clip_seq and app.last_clip_text is not None:
+        logging.debug("Clipboard unchanged - using cached text")
+        return app.last_clip_text
+    
+    # Taken before reading, so a change during the read is seen next time
+    app.last_clip_seq = seq
+    app.last_clip_text = read_clipboard()
+    return app.last_clip_text
+
 def detect_language(text):
     """Detect language of text and return appropriate voice ID"""
-    # Check for Cyrillic characters (Russian)
-    cyrillic_match = re.search(r'[а-яё]', text.lower())
-    if cyrillic_match:
-        logging.info(f"Russian text detected (found: '{cyrillic_match.group()}')")
-        return 'HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_RU-RU_IRINA_11.0'
-    
-    # Check for Hebrew characters
-    hebrew_match = re.search(r'[\u0590-\u05ff]', text)
-    if hebrew_match:
-        logging.info("Hebrew text detected, but no Hebrew voice available")
-        return None
+    # The start of the text is enough to tell the language, so huge
+    # clipboards don't cost more than small ones
+    sample = text[:LANGUAGE_SAMPLE_CHARS]
+    
+    # ASCII-only text can't be Russian or Hebrew; str.isascii() is a single
+    # C-level check, so the common English case skips both regex scans
+    if not sample.isascii():
+        # Check for Cyrillic characters (Russian)
+        cyrillic_match = _CYRILLIC_RE.search(sample)
+        if cyrillic_match:
+            logging.info("Russian text detected (found: '%s')", cyrillic_match.group())
+            return 'HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_RU-RU_IRINA_11.0'
+        
+        # Check for Hebrew characters
+        hebrew_match = _HEBREW_RE.search(sample)
+        if hebrew_match:
+            logging.info("Hebrew text detected, but no Hebrew voice available")
+            return None
     
     # Default to English
     logging.info("English text detected (default)")
     return 'HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_EN-US_ZIRA_11.0'
 
-def set_voice_by_language(text):
+def set_voice_by_language(app, text):
     """Set the appropriate voice based on detected language"""
-    global voice
-    
+    voice = app.voice
     if not voice:
         return
     
     try:
-        voice_id = detect_language(text)
-        if voice_id:
-            voices = voice.GetVoices()
-            for i in range(voices.Count):
-                if voices.Item(i).Id == voice_id:
-                    voice.Voice = voices.Item(i)
-                    logging.info(f"Switched to voice: {voices.Item(i).GetDescription()}")
-                    
-                    # Apply speech rate and volume settings to the new voice
-                    apply_voice_settings()
-                    break
+        # Repeated reads of an unchanged clipboard pass the same cached string
+        if text is app.detected_text:
+            voice_id = app.detected_voice_id
+        else:
+            voice_id = detect_language(text)
+            app.detected_text = text
+            app.detected_voice_id = voice_id
+        
+        if voice_id == app.current_voice_id:
+            return  # Already selected - skip the COM calls
+        
+        # A dict lookup instead of enumerating the voices over COM
+        token = _voice_token_cache.get(voice_id) if voice_id else None
+        if token is not None:
+            voice.Voice = token
+            app.current_voice_id = voice_id
+            logging.info("Switched to voice: %s", get_voice_name(voice_id))
+            
+            # Apply speech rate and volume settings to the new voice
+            apply_voice_settings(app)
     except Exception as e:
         logging.error(f"Error setting voice by language: {e}")
 
-def speak_text(text):
-    """Convert text to speech using SAPI with interruption support"""
-    global voice
+def speak_in_chunks(voice, text):
+    """Speak text, handing long text to SAPI sentence by sentence"""
+    # SAPI starts talking once the first chunk is processed instead of after
+    # ingesting the whole paste; later chunks are queued without purging
+    if len(text) > SPEECH_CHUNK_MIN_CHARS:
+        chunks = _SENTENCE_END_RE.split(text, MAX_SPEECH_CHUNKS - 1)
+    else:
+        chunks = [text]
     
-    if not voice:
+    voice.Speak(chunks[0], SVSF_ASYNC_PURGE)
+    for chunk in chunks[1:]:
+        voice.Speak(chunk, SVSF_ASYNC)
+
+def is_voice_dead(error):
+    """Return whether a COM error means the SAPI voice must be recreated"""
+    hresult = error.hresult
+    # Calls through the late-bound Dispatch wrapper report most SAPI failures
+    # as DISP_E_EXCEPTION, with the underlying scode in excepinfo[5]
+    if hresult == DISP_E_EXCEPTION and error.excepinfo:
+        hresult = error.excepinfo[5]
+    return hresult in VOICE_RECOVERY_HRESULTS
+
+def speak_text(app, text):
+    """Convert text to speech using SAPI with interruption support"""
+    if not app.voice:
         logging.error("Voice not initialized")
         return
     
     try:
-        # Ensure COM is initialized for this thread
-        pythoncom.CoInitialize()
-        
         # Set appropriate voice based on language
-        set_voice_by_language(text)
-        
-        # Stop any current speech and clear the queue
-        voice.Speak("", 3)  # SVSFlagsAsync | SVSFPurgeBeforeSpeak
+        set_voice_by_language(app, text)
         
-        # Start new speech
-        logging.info(f"Starting TTS for text of length {len(text)}")
-        voice.Speak(text, 3)  # SVSFlagsAsync | SVSFPurgeBeforeSpeak
+        # Start new speech - purging also stops any speech in progress
+        logging.info("Starting TTS for text of length %d", len(text))
+        speak_in_chunks(app.voice, text)
         
-    except Exception as e:
+    except pywintypes.com_error as e:
         logging.error(f"Error in speak_text: {e}")
-        # Try to reinitialize voice on COM error
-        if "CoInitialize" in str(e) or "-2147221008" in str(e) or "-2147352567" in str(e):
+        # Only recreate the voice (a slow Dispatch) when the error says the
+        # current one is unusable, not for every transient COM failure
+        if is_voice_dead(e):
             logging.warning("COM error detected - attempting to reinitialize voice")
             try:
-                pythoncom.CoInitialize()
-                voice = win32com.client.Dispatch("SAPI.SpVoice")
-                # Set appropriate voice for the text and apply settings
-                set_voice_by_language(text)
-                voice.Speak(text, 3)
+                app.voice = win32com.client.Dispatch("SAPI.SpVoice")
+                # The cached tokens came from the old voice's GetVoices() and
+                # may have gone with it, so enumerate them again
+                _voice_token_cache.clear()
+                cache_voice_tokens(app.voice)
+                # The new voice starts with the default; clearing the current ID
+                # makes set_voice_by_language() select and configure it
+                app.current_voice_id = None
+                set_voice_by_language(app, text)
+                if app.current_voice_id is None:
+                    apply_voice_settings(app)  # No voice switch to configure it
+                speak_in_chunks(app.voice, text)
                 logging.info("Voice reinitialized successfully")
             except Exception as reinit_error:
                 logging.error(f"Failed to reinitialize voice: {reinit_error}")
+    except Exception as e:
+        logging.error(f"Error in speak_text: {e}")
 
-def handle_read_request():
-    """Handle read clipboard request"""
-    global last_hotkey_time
-    last_hotkey_time = time.time()
-    
-    text = read_clipboard()
-    if text:
-        event_queue.put('read')
-        print(f"Reading: {text}")
-        speak_text(text)
-    else:
-        print("Clipboard empty – nothing to read.")
-
-def handle_stop_request():
-    """Handle stop speech request"""
-    global last_hotkey_time
-    last_hotkey_time = time.time()
-    
-    event_queue.put('stop')
+def stop_speech(app):
+    """Stop current speech and clear the SAPI queue"""
     try:
-        if voice:
-            voice.Speak("", 3)  # Stop current speech
+        if app.voice:
+            app.voice.Speak("", SVSF_ASYNC_PURGE)  # Stop current speech
         print("🛑 Speech stopped")
         logging.info("Speech stopped by user")
     except Exception as e:
         logging.error(f"Error stopping speech: {e}")
 
-def register_hotkeys():
-    """Register global hotkeys using keyboard library with robust error handling"""
-    global hotkey_handlers
-    
-    # Skip if hotkeys are already registered
-    if hotkey_handlers:
-        logging.debug("Hotkeys already registered, skipping")
-        return True
-    
+def pump_messages():
+    """Dispatch all window and COM messages waiting for the current thread"""
+    while True:
+        has_message, message = win32gui.PeekMessage(0, 0, 0, win32con.PM_REMOVE)
+        if not has_message:
+            break
+        win32gui.TranslateMessage(message)
+        win32gui.DispatchMessage(message)
+
+def queue_tts_command(app, command, text=None):
+    """Queue a command for the TTS worker and wake it up"""
+    app.tts_queue.put((command, text))
+    if app.tts_event:
+        win32event.SetEvent(app.tts_event)
+
+def tts_worker(app):
+    """Own the SAPI voice on a single STA thread and run queued TTS commands"""
+    # The voice is tied to the apartment it was created in, so it is only
+    # ever created and used from this thread
+    pythoncom.CoInitialize()
     try:
-        # Ensure clean state - remove all hotkeys first
-        try:
-            keyboard.unhook_all_hotkeys()
-        except:
-            pass
-        
-        # Register new hotkeys with multiple attempts
-        for attempt in range(3):
-            try:
-                handler1 = keyboard.add_hotkey('alt+q', handle_read_request, suppress=False)
-                handler2 = keyboard.add_hotkey('alt+shift+q', handle_stop_request, suppress=False)
-                
-                if handler1 and handler2:
-                    hotkey_handlers = [handler1, handler2]
-                    logging.info("Keyboard library hotkeys registered successfully")
-                    return True
-                else:
-                    logging.warning(f"Hotkey registration attempt {attempt + 1} returned None")
-                    
-            except Exception as e:
-                logging.warning(f"Hotkey registration attempt {attempt + 1} failed: {e}")
-                
-            if attempt < 2:
-                time.sleep(0.5)  # Wait before retry
+        setup_voice(app)
+        if app.voice:
+            if app.list_voices:
+                list_available_voices(app)
+            
+            # Hotkey notifications arrive as messages for this thread's
+            # window and are dispatched by the pump below
+            create_message_window(app)
+            register_hotkeys(app)
         
-        logging.error("Failed to register hotkeys after 3 attempts")
-        return False
+        app.worker_ready.set()
+        if not app.voice:
+            return
         
-    except Exception as e:
-        logging.error(f"Error in register_hotkeys: {e}")
+        # Standard STA message loop: dispatch SAPI/window messages as they
+        # arrive and run commands when tts_event is signaled
+        while True:
+            pump_messages()
+            
+            # Clipboard reads happen on the main loop and Speak() is async,
+            # so commands here finish quickly. Every read purges the previous
+            # speech, so only the newest command matters - a stop never waits
+            # behind stale reads
+            command = text = None
+            while command != 'quit':
+                try:
+                    command, text = app.tts_queue.get_nowait()
+                except queue.Empty:
+                    break
+                logging.debug("TTS worker command: %s", command)
+            
+            if command == 'read':
+                speak_text(app, text)
+            elif command == 'stop':
+                stop_speech(app)
+            elif command == 'quit':
+                if app.voice:
+                    try:
+                        app.voice.Speak("", SVSF_ASYNC_PURGE)  # Stop any ongoing speech
+                    except:
+                        pass
+                return
+            
+            # COM calls made while speaking can peek at the queue, which marks
+            # a waiting WM_HOTKEY as seen; without MWMO_INPUTAVAILABLE the
+            # wait would sleep on it until some other message arrived
+            win32event.MsgWaitForMultipleObjectsEx(
+                [app.tts_event], win32event.INFINITE, win32event.QS_ALLINPUT,
+                MWMO_INPUTAVAILABLE)
+    finally:
+        unregister_hotkeys(app)
+        destroy_message_window(app)
+        app.worker_ready.set()
+        pythoncom.CoUninitialize()
+
+def start_tts_worker(app):
+    """Start the TTS worker thread and wait until its voice and hotkeys are set up"""
+    app.tts_event = win32event.CreateEvent(None, False, False, None)
+    app.tts_thread = threading.Thread(target=tts_worker, args=(app,), daemon=True)
+    app.tts_thread.start()
+    app.worker_ready.wait()
+
+def post_event(app, event):
+    """Queue an event for the main loop and wake it up"""
+    try:
+        app.event_queue.put_nowait(event)
+    except queue.Full:
+        # The main loop is far behind; drop the event rather than block the
+        # hotkey handler. Reads are still cancelled by a dropped 'stop', as
+        # they are checked against app.stop_requests
+        logging.debug("Event queue full - dropping event: %s", event)
+    if app.wake_event:
+        win32event.SetEvent(app.wake_event)
+
+def handle_read_request(app):
+    """Handle read clipboard request"""
+    app.last_hotkey_time = time.monotonic()
+    
+    # The clipboard may need to be waited for, so it is read by the main
+    # loop; hotkeys arrive on the TTS worker, which must stay free for stops
+    app.read_stop_requests = app.stop_requests
+    post_event(app, 'read')
+
+def handle_stop_request(app):
+    """Handle stop speech request"""
+    app.last_hotkey_time = time.monotonic()
+    
+    app.stop_requests += 1
+    post_event(app, 'stop')
+    queue_tts_command(app, 'stop')
+
+def read_and_speak(app):
+    """Read the clipboard on the main loop and queue it for the TTS worker"""
+    # Any stop since the latest read was requested cancels it, even one
+    # whose event was dropped or that arrives during the clipboard read
+    stop_requests = app.read_stop_requests
+    if app.stop_requests != stop_requests:
+        logging.info("Read cancelled by a later stop")
+        return
+    
+    text = get_clipboard_text(app)
+    if not text:
+        print("Clipboard empty – nothing to read.")
+        return
+    
+    if app.stop_requests != stop_requests:
+        logging.info("Read cancelled by a stop during the clipboard read")
+        return
+    
+    print(f"Reading: {text}")
+    queue_tts_command(app, 'read', text)
+
+def register_hotkeys(app):
+    """Register global hotkeys with RegisterHotKey on the message window"""
+    if not app.message_hwnd:
+        app.failed_hotkeys = [name for _, _, name in HOTKEYS]
+        app.hotkeys_registered = False
         return False
+    
+    # The OS matches the key combination itself and posts WM_HOTKEY, so no
+    # keyboard hook sees the user's other keystrokes. Each hotkey gets a
+    # single attempt: RegisterHotKey only fails when another application
+    # owns the combination, which retrying won't change, and one taken
+    # combination shouldn't disable the other
+    failed = []
+    for hotkey_id, modifiers, name in HOTKEYS:
+        if not _user32.RegisterHotKey(app.message_hwnd, hotkey_id,
+                                      modifiers | MOD_NOREPEAT, VK_Q):
+            failed.append(name)
+            logging.error(f"Failed to register {name}: {ctypes.WinError(ctypes.get_last_error())}")
+    
+    app.failed_hotkeys = failed
+    app.hotkeys_registered = not failed
+    if app.hotkeys_registered:
+        logging.info("Global hotkeys registered with RegisterHotKey")
+    return app.hotkeys_registered
+
+def describe_hotkey_failure(app):
+    """Describe which hotkeys failed to register, for the console and notifications"""
+    if len(app.failed_hotkeys) < len(HOTKEYS):
+        working = [name for _, _, name in HOTKEYS if name not in app.failed_hotkeys]
+        return (f"{', '.join(app.failed_hotkeys)} could not be registered - "
+                f"{', '.join(working)} still works")
+    return "Global hotkeys failed - Alt+Q may be in use by another application"
 
-def unregister_hotkeys():
+def unregister_hotkeys(app):
     """Unregister global hotkeys"""
-    global hotkey_handlers
+    if not app.message_hwnd:
+        return
     
     try:
-        # Use unhook_all_hotkeys for clean removal
-        keyboard.unhook_all_hotkeys()
-        hotkey_handlers.clear()
+        for hotkey_id, _, _ in HOTKEYS:
+            _user32.UnregisterHotKey(app.message_hwnd, hotkey_id)
+        app.hotkeys_registered = False
         logging.info("Hotkeys unregistered")
         
     except Exception as e:
         logging.error(f"Error unregistering hotkeys: {e}")
 
-
-
-def test_hotkeys():
-    """Test if hotkeys are still working"""
-    try:
-        # Simple test - check if keyboard module is responsive
-        keyboard.is_pressed('alt')
-        return True
-    except Exception as e:
-        logging.warning(f"Hotkey test failed: {e}")
-        return False
+def reregister_hotkeys(app):
+    """Ask the TTS worker, which owns the hotkeys, to register them again"""
+    if app.message_hwnd:
+        win32gui.PostMessage(app.message_hwnd, WM_REREGISTER_HOTKEYS, 0, 0)
 
 def create_tray_icon():
-    """Create a simple icon for the system tray"""
-    # Create a simple icon
-    width = height = 64
-    image = Image.new('RGB', (width, height), color='blue')
-    draw = ImageDraw.Draw(image)
-    
-    # Draw a simple microphone icon
-    draw.ellipse([16, 40, 48, 56], fill='white')  # Base
-    draw.rectangle([28, 20, 36, 40], fill='white')  # Handle
-    draw.ellipse([20, 8, 44, 32], fill='white')  # Mic head
+    """Load the pre-rendered system tray icon"""
+    from PIL import Image
     
-    return image
+    return Image.open(io.BytesIO(base64.b64decode(_ICON_PNG)))
 
-def show_notification(title, message):
+def show_notification(app, title, message):
     """Show a system notification"""
-    global tray_icon
-    if tray_icon and not debug_mode:
-        tray_icon.notify(message, title)
-    elif debug_mode:
+    if app.tray_icon and not app.debug_mode:
+        app.tray_icon.notify(message, title)
+    elif app.debug_mode:
         print(f"{title}: {message}")
 
-def quit_application():
+def quit_application(app):
     """Quit the application"""
-    global running, tray_icon
-    running = False
-    unregister_hotkeys()
-    if voice:
-        try:
-            voice.Speak("", 3)  # Stop any ongoing speech
-        except:
-            pass
-    if tray_icon:
-        tray_icon.stop()
-    pythoncom.CoUninitialize()
+    app.running = False
+    if app.wake_event:
+        win32event.SetEvent(app.wake_event)  # Let the main loop notice we're quitting
+    if app.tts_thread and app.tts_thread.is_alive():
+        queue_tts_command(app, 'quit')
+        if threading.current_thread() is not app.tts_thread:
+            app.tts_thread.join(timeout=1)
+    if app.tray_icon:
+        app.tray_icon.stop()
     sys.exit(0)
 
-def show_about():
+def show_about(app):
     """Show about information"""
     about_text = """SendToTTS v1.1.0
     
@@ -383,35 +730,38 @@ Hotkeys:
 • Alt+Shift+Q - Stop speech
 
 Settings: Edit settings.ini to adjust speech rate and volume"""
-    show_notification("About SendToTTS", about_text)
+    show_notification(app, "About SendToTTS", about_text)
 
-def create_tray_menu():
+def create_tray_menu(app):
     """Create the system tray menu"""
+    import pystray
+    
     return pystray.Menu(
         pystray.MenuItem("SendToTTS v1.1.3", lambda: None, enabled=False),
         pystray.Menu.SEPARATOR,
-        pystray.MenuItem("Read Clipboard (Alt+Q)", lambda: handle_read_request()),
-        pystray.MenuItem("Stop Speech (Alt+Shift+Q)", lambda: handle_stop_request()),
+        pystray.MenuItem("Read Clipboard (Alt+Q)", lambda: handle_read_request(app)),
+        pystray.MenuItem("Stop Speech (Alt+Shift+Q)", lambda: handle_stop_request(app)),
+        pystray.MenuItem("Re-register Hotkeys", lambda: reregister_hotkeys(app)),
         pystray.Menu.SEPARATOR,
-        pystray.MenuItem("About", lambda: show_about()),
-        pystray.MenuItem("Quit", lambda: quit_application())
+        pystray.MenuItem("About", lambda: show_about(app)),
+        pystray.MenuItem("Quit", lambda: quit_application(app))
     )
 
-def setup_tray():
+def setup_tray(app):
     """Setup system tray icon"""
-    global tray_icon
-    
     try:
+        import pystray
+        
         icon_image = create_tray_icon()
-        tray_icon = pystray.Icon(
+        app.tray_icon = pystray.Icon(
             "SendToTTS",
             icon_image,
             "SendToTTS - Clipboard to Speech",
-            menu=create_tray_menu()
+            menu=create_tray_menu(app)
         )
         
         # Run tray icon in a separate thread
-        tray_thread = threading.Thread(target=tray_icon.run, daemon=True)
+        tray_thread = threading.Thread(target=app.tray_icon.run, daemon=True)
         tray_thread.start()
         
         logging.info("System tray icon created")
@@ -420,18 +770,40 @@ def setup_tray():
         logging.error(f"Failed to create system tray icon: {e}")
         # Continue without tray icon
 
-def check_for_enter_key():
-    """Check for Enter key press (local fallback) - only in debug mode"""
-    if debug_mode and msvcrt.kbhit():
-        key = msvcrt.getch()
-        if key == b'\r':  # Enter key
-            logging.info("Enter key pressed (local fallback)")
-            print("🔄 Enter pressed - reading clipboard...")
-            handle_read_request()
+def read_console_input(app):
+    """Read Enter presses from the console (local fallback) - only in debug mode"""
+    while app.running:
+        line = sys.stdin.readline()
+        if not line:  # stdin closed
+            break
+        logging.info("Enter key pressed (local fallback)")
+        print("🔄 Enter pressed - reading clipboard...")
+        app.read_stop_requests = app.stop_requests
+        post_event(app, 'enter')
 
-def hide_console_window():
+def start_console_reader(app):
+    """Start a daemon thread that blocks on stdin instead of polling the keyboard"""
+    if app.debug_mode and sys.stdin:
+        reader_thread = threading.Thread(target=read_console_input, args=(app,), daemon=True)
+        reader_thread.start()
+
+def stop_on_console_ctrl(app, ctrl_type):
+    """Stop the main loop on Ctrl+C or Ctrl+Break while it is blocked waiting"""
+    if ctrl_type not in (win32con.CTRL_C_EVENT, win32con.CTRL_BREAK_EVENT):
+        return False
+    
+    # This runs on its own thread, so Python's KeyboardInterrupt could arrive
+    # only after the main loop is back in its wait - stop the loop directly
+    print("\n🔄 Shutting down...")
+    logging.info("Application shutting down")
+    app.running = False
+    if app.wake_event:
+        win32event.SetEvent(app.wake_event)
+    return True  # Handled - don't also raise KeyboardInterrupt
+
+def hide_console_window(app):
     """Hide the console window for windowless operation"""
-    if not debug_mode:
+    if not app.debug_mode:
         # Get console window handle
         console_window = ctypes.windll.kernel32.GetConsoleWindow()
         if console_window:
@@ -440,29 +812,43 @@ def hide_console_window():
 
 def main():
     """Main application entry point"""
-    global running, debug_mode
-    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='SendToTTS - Clipboard to Text-to-Speech')
     parser.add_argument('--debug', action='store_true', 
                        help='Run in debug mode with console window')
+    parser.add_argument('--list-voices', action='store_true',
+                       help='Print installed TTS voices at startup (use with --debug)')
     args = parser.parse_args()
     
-    debug_mode = args.debug
+    # All mutable application state lives here rather than in module globals
+    app = TTSApp(debug_mode=args.debug, list_voices=args.list_voices)
+    debug_mode = app.debug_mode
     
     # Hide console window if not in debug mode (this is now the default)
-    hide_console_window()
+    hide_console_window(app)
     
     # Configure logging based on mode
     if debug_mode:
-        # Console mode - show everything and log to file
+        # Console mode - log to console and file. Records are only enqueued
+        # on the calling thread; a listener thread formats and writes them,
+        # so tts_debug.log stays current without file I/O on the hotkey path
+        log_level = getattr(logging, os.environ.get('SENDTOTTS_LOG_LEVEL', 'INFO').upper(),
+                            logging.INFO)
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('tts_debug.log')
+        file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler)
+        log_listener.start()
+        atexit.register(log_listener.stop)  # Drain the queue before logging shuts down
+        
         logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('tts_debug.log'),
-                logging.StreamHandler()
-            ]
+            level=log_level,
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         print("Starting Clipboard to TTS Application...")
         print("\n=== Clipboard → TTS ===")
@@ -478,16 +864,12 @@ def main():
     
     logging.info("Application starting")
     
-    # Initialize COM first
-    pythoncom.CoInitialize()
+    # Auto-reset event signaled by hotkey handlers, the console reader and quit
+    app.wake_event = win32event.CreateEvent(None, False, False, None)
     
-    # List available voices (only in debug mode)
-    if debug_mode:
-        list_available_voices()
-    
-    # Setup voice
-    setup_voice()
-    if not voice:
+    # Setup voice on the dedicated TTS worker thread
+    start_tts_worker(app)
+    if not app.voice:
         if debug_mode:
             print("❌ Failed to initialize TTS voice")
         logging.error("Failed to initialize TTS voice")
@@ -500,81 +882,74 @@ def main():
         print(" Enter – read clipboard (LOCAL - works only in this window)")
         print(" Ctrl+C – exit")
     
-    # Register hotkeys
-    if register_hotkeys():
+    # Hotkeys are registered by the TTS worker, which owns their window
+    if app.hotkeys_registered:
         if debug_mode:
             print("✅ Global hotkeys registered successfully")
         logging.info("Global hotkeys registered successfully")
     else:
+        hotkey_failure = describe_hotkey_failure(app)
         if debug_mode:
-            print("⚠️  Global hotkeys failed - Enter key fallback available")
-        logging.warning("Global hotkeys failed")
+            print(f"⚠️  {hotkey_failure} - Enter key fallback available")
+        logging.warning(hotkey_failure)
     
     # Setup system tray (now runs in both modes, but only shows notifications in tray mode)
-    setup_tray()
+    setup_tray(app)
     
     if debug_mode:
+        start_console_reader(app)
+        win32api.SetConsoleCtrlHandler(lambda ctrl_type: stop_on_console_ctrl(app, ctrl_type), True)
         print("Listening for hot-keys… (press Ctrl+C to quit)")
     else:
-        show_notification("SendToTTS Started", "Clipboard to speech is ready. Use Alt+Q to read clipboard.")
+        show_notification(app, "SendToTTS Started", "Clipboard to speech is ready. Use Alt+Q to read clipboard.")
     
     logging.info("Main loop starting")
     
-    last_heartbeat = time.time()
-    last_hotkey_test = time.time()
+    next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL
     
     try:
-        while running:
-            # Check for Enter key (local fallback) - only in debug mode
-            if debug_mode:
-                check_for_enter_key()
+        while app.running:
+            # Sleep until an event is posted or the next heartbeat is due
+            # (SAPI and hotkey messages are pumped by the TTS worker)
+            timeout_ms = max(0, math.ceil((next_heartbeat - time.monotonic()) * 1000))
+            win32event.WaitForSingleObject(app.wake_event, timeout_ms)
             
-            # Process event queue
-            try:
-                event = event_queue.get_nowait()
-                logging.debug(f"Processing event: {event}")
-            except queue.Empty:
-                pass
+            # Process event queue - reads pending at the same time collapse
+            # into one, and a later stop cancels them
+            read_pending = False
+            while True:
+                try:
+                    event = app.event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                logging.debug("Processing event: %s", event)
+                if event in ('read', 'enter'):
+                    read_pending = True
+                elif event == 'stop':
+                    read_pending = False
             
-            # Pump COM messages for SAPI
-            pythoncom.PumpWaitingMessages()
+            if read_pending:
+                read_and_speak(app)
             
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Heartbeat every 30 seconds (only log in debug mode)
-            if current_time - last_heartbeat >= 30:
-                time_since_hotkey = current_time - last_hotkey_time
+            if current_time >= next_heartbeat:
+                time_since_hotkey = current_time - app.last_hotkey_time
                 if debug_mode:
-                    logging.debug(f"Heartbeat - Last hotkey: {time_since_hotkey:.1f}s ago")
-                last_heartbeat = current_time
-            
-            # Test hotkeys every 60 seconds and re-register if needed
-            if current_time - last_hotkey_test >= 60:
-                if not test_hotkeys():
-                    logging.warning("Hotkey test failed - attempting to re-register")
-                    # Clear existing hotkeys first
-                    unregister_hotkeys()
-                    if register_hotkeys():
-                        if debug_mode:
-                            print("🔄 Hotkeys re-registered successfully")
-                        logging.info("Hotkeys re-registered successfully")
-                    else:
-                        if debug_mode:
-                            print("⚠️  Hotkey re-registration failed - Enter key still available")
-                        logging.warning("Hotkey re-registration failed")
-                else:
-                    if debug_mode:
-                        logging.debug("Hotkey test passed - no re-registration needed")
-                last_hotkey_test = current_time
-            
-            time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                    logging.debug("Heartbeat - Last hotkey: %.1fs ago", time_since_hotkey)
+                # Stay on the 30 s schedule unless we fell a whole interval
+                # behind (e.g. the machine was asleep)
+                next_heartbeat += HEARTBEAT_INTERVAL
+                if next_heartbeat <= current_time:
+                    next_heartbeat = current_time + HEARTBEAT_INTERVAL
             
     except KeyboardInterrupt:
         if debug_mode:
             print("\n🔄 Shutting down...")
         logging.info("Application shutting down")
     finally:
-        quit_application()
+        quit_application(app)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file